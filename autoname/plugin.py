@@ -1,4 +1,4 @@
-import datetime, os, re, unicodedata
+import datetime, logging, os, re, unicodedata
 
 from gi.repository import GObject, Gedit, Gio
 
@@ -6,6 +6,16 @@ from gi.repository import GObject, Gedit, Gio
 __all__ = ["AutonamePlugin"]
 
 
+log = logging.getLogger(__name__)
+
+# Autonamed files are named "<title> YYYYMMDDHHMMSS.txt".
+DATETIME_FORMAT = "%Y%m%d%H%M%S"
+SUFFIX_LENGTH = len(" YYYYMMDDHHMMSS.txt")
+
+SLUGIFY_STRIP_REGEX = re.compile(r"[^\w\s-]")
+SLUGIFY_HYPHENATE_REGEX = re.compile(r"[-\s]+")
+
+
 class AutonamePlugin(GObject.Object, Gedit.WindowActivatable):
     __gtype_name__ = "AutonamePlugin"
 
@@ -13,8 +23,10 @@ class AutonamePlugin(GObject.Object, Gedit.WindowActivatable):
 
     def __init__(self):
         GObject.Object.__init__(self)
+        # Always ends in a separator, so filenames can be appended directly
+        # without os.path.join().
         self.desktop_path = os.path.expanduser("~/Desktop/")
-        self.path_regex = re.compile("^" + self.desktop_path + r".* \d{14}\.txt$")
+        self.min_autonamed_path_length = len(self.desktop_path) + SUFFIX_LENGTH
 
     def do_activate(self):
         self.window.autoname_plugin_handler_ids = [
@@ -29,6 +41,8 @@ class AutonamePlugin(GObject.Object, Gedit.WindowActivatable):
         for handler_id in self.window.autoname_plugin_handler_ids:
             self.window.disconnect(handler_id)
 
+        del self.window.autoname_plugin_handler_ids
+
     def tab_added(self, window, tab):
         self.maybe_set_name(tab.get_document())
 
@@ -42,24 +56,28 @@ class AutonamePlugin(GObject.Object, Gedit.WindowActivatable):
         if not document.is_untitled():
             return
 
-        datetimestr = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-        filename = f"Untitled {datetimestr}.txt"
-        path = os.path.join(self.desktop_path, filename)
+        path = (
+            f"{self.desktop_path}Untitled "
+            f"{datetime.datetime.now():{DATETIME_FORMAT}}.txt"
+        )
         document.get_file().set_location(Gio.file_new_for_path(path))
 
     def maybe_rename(self, document):
-        if not self.is_autonamed(document):
+        original_path = self.autonamed_path(document)
+
+        if not original_path:
             return
 
-        original_path = document.get_file().get_location().get_path()
         title = self.title(document)
 
         if not title:
             return
 
-        datetimestr = os.path.splitext(original_path)[0][-len("YYYYMMDDHHMMSS") :]
-        filename = f"{title} {datetimestr}.txt"
-        new_path = os.path.join(self.desktop_path, filename)
+        # autonamed_path() guarantees the path ends in " YYYYMMDDHHMMSS.txt".
+        new_path = f"{self.desktop_path}{title}{original_path[-SUFFIX_LENGTH:]}"
+
+        if new_path == original_path:
+            return
 
         try:
             os.rename(original_path, new_path)
@@ -71,37 +89,52 @@ class AutonamePlugin(GObject.Object, Gedit.WindowActivatable):
         document.autoname_plugin_last_renamed_to = new_path
 
     def maybe_delete(self, document):
-        if not self.is_autonamed(document):
-            return
+        path = self.autonamed_path(document)
 
-        path = document.get_file().get_location().get_path()
-        filename = os.path.split(path)[1]
+        if not path:
+            return
 
         if not self.title(document):
             try:
                 os.remove(path)
             except FileNotFoundError:
                 pass
+            except OSError as err:
+                log.warning("Failed to delete autonamed document %s: %s", path, err)
 
-    def is_autonamed(self, document):
+    def autonamed_path(self, document):
         if not document:
-            return False
+            return None
 
         location = document.get_file().get_location()
 
         if not location:
-            return False
+            return None
 
-        return self.path_regex.match(location.get_path())
+        # Match "<desktop_path>* YYYYMMDDHHMMSS.txt" without the regex engine.
+        path = location.get_path()
+        if (
+            len(path) >= self.min_autonamed_path_length
+            and path.startswith(self.desktop_path)
+            and path.endswith(".txt")
+            and path[-SUFFIX_LENGTH] == " "
+            and path[1 - SUFFIX_LENGTH : -4].isdecimal()
+        ):
+            return path
+
+        return None
 
     def title(self, document):
-        if not document:
+        if not document or not document.get_char_count():
             return None
 
         text = document.get_text(
             document.get_start_iter(), document.get_iter_at_offset(1000), False
         )
 
+        if text.isspace():
+            return None
+
         lines = text.split("\n")
 
         for line in lines:
@@ -127,5 +160,5 @@ def slugify(value):
     value = (
         unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     )
-    value = re.sub(r"[^\w\s-]", "", value).strip()
-    return re.sub(r"[-\s]+", " ", value)
+    value = SLUGIFY_STRIP_REGEX.sub("", value).strip()
+    return SLUGIFY_HYPHENATE_REGEX.sub(" ", value)